@@ -71,9 +71,19 @@ def _clip_angles_inside_coordinate_range(zenith_angle, zenith_secant_max):
     """
     clip_angle = np.nan_to_num(np.rad2deg(np.arccos(1. / zenith_secant_max)))
     zang = np.nan_to_num(zenith_angle)
+    if isinstance(zang, np.ndarray) and np.issubdtype(zang.dtype, np.floating):
+        # nan_to_num already returned a copy, so clip that one in place
+        return np.clip(zang, 0, clip_angle, out=zang)
     return np.clip(zang, 0, clip_angle)
 
 
+def _get_zenith_secant(zenith_angle, out):
+    """Compute the secant of a zenith angle in degrees into the flat array *out*."""
+    np.deg2rad(zenith_angle.ravel(), out=out)
+    np.cos(out, out=out)
+    return np.reciprocal(out, out=out)
+
+
 class RayleighConfigBaseClass(object):
     """A base class for the Atmospheric correction, handling the configuration and LUT download."""
 
@@ -217,15 +227,15 @@ class Rayleigh(RayleighConfigBaseClass):
 
     @staticmethod
     def _interp_rayleigh_refl_by_angles(sun_zenith, sat_zenith, azidiff,
-                                        rayleigh_refl, reflectance_lut_filename):
-        azid_coord, satz_sec_coord, sunz_sec_coord = get_reflectance_lut_from_file(
-            reflectance_lut_filename)
-
+                                        rayleigh_refl, azid_coord, satz_sec_coord, sunz_sec_coord):
+        # The interpolator works in float64, so fill its points array directly
+        # instead of stacking separately allocated secant arrays
+        interp_points = np.empty((3, sun_zenith.size), dtype=np.float64)
         sun_zenith = _clip_angles_inside_coordinate_range(sun_zenith, sunz_sec_coord.max())
-        sunzsec = 1. / np.cos(np.deg2rad(sun_zenith))
-
+        _get_zenith_secant(sun_zenith, out=interp_points[0])
+        np.subtract(180, azidiff.ravel(), out=interp_points[1])
         sat_zenith = _clip_angles_inside_coordinate_range(sat_zenith, satz_sec_coord.max())
-        satzsec = 1. / np.cos(np.deg2rad(sat_zenith))
+        _get_zenith_secant(sat_zenith, out=interp_points[2])
 
         smin = [sunz_sec_coord[0], azid_coord[0], satz_sec_coord[0]]
         smax = [sunz_sec_coord[-1], azid_coord[-1], satz_sec_coord[-1]]
@@ -235,10 +245,9 @@ class Rayleigh(RayleighConfigBaseClass):
 
         minterp = MultilinearInterpolator(smin, smax, orders)
         minterp.set_values(f_3d_grid)
-        interp_points2 = np.vstack((sunzsec.ravel(), 180 - azidiff.ravel(), satzsec.ravel()))
-        res = minterp(interp_points2)
+        res = minterp(interp_points)
         res *= 100
-        return res.reshape(sunzsec.shape)
+        return res.reshape(sun_zenith.shape)
 
     def get_reflectance(self, sun_zenith, sat_zenith, azidiff,
                         band_name_or_wavelength, redband=None):
@@ -259,9 +268,12 @@ class Rayleigh(RayleighConfigBaseClass):
             zeros_like = np.zeros_like if isinstance(repr_arr, np.ndarray) else da.zeros_like
             res = zeros_like(repr_arr)
         else:
+            # Read the LUT coordinates once here rather than reopening the file for every chunk
+            azid_coord, satz_sec_coord, sunz_sec_coord = get_reflectance_lut_from_file(
+                self.reflectance_lut_filename)
             res = _map_blocks_or_direct_call(self._interp_rayleigh_refl_by_angles,
                                              sun_zenith, sat_zenith, azidiff, rayleigh_refl,
-                                             self.reflectance_lut_filename,
+                                             azid_coord, satz_sec_coord, sunz_sec_coord,
                                              meta=np.array((), dtype=rayleigh_refl.dtype),
                                              dtype=rayleigh_refl.dtype,
                                              chunks=getattr(azidiff, "chunks", None))
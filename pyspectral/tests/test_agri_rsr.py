@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Pytroll developers
+#
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit testing the FY-4 AGRI RSR conversion script."""
+import os
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'rsr_convert_scripts')
+if not os.path.isdir(SCRIPTS_DIR):
+    pytest.skip("RSR convert scripts not available", allow_module_level=True)
+sys.path.insert(0, SCRIPTS_DIR)
+agri_rsr = pytest.importorskip('agri_rsr')
+
+
+@pytest.fixture
+def fake_agri_config(tmp_path):
+    """Create fake AGRI band files and a config pointing to them."""
+    band_config = {'path': str(tmp_path)}
+    for band in agri_rsr.FY4_AGRI_BAND_NAMES:
+        filename = f'{band}.txt'
+        with open(tmp_path / filename, 'w') as fpt:
+            fpt.write('wavelength\tresponse\n500\t0.5\n501\t80\n502\t0.0001\n')
+        band_config[band] = filename
+    agri_rsr.AGRIRSR.clear_cache()
+    yield {'rsr_dir': str(tmp_path), 'FY-4B-agri': band_config}
+    agri_rsr.AGRIRSR.clear_cache()
+
+
+def test_load(fake_agri_config):
+    """Test loading an AGRI band, scaling percentages and cutting low responses."""
+    with patch('pyspectral.raw_reader.get_config', return_value=fake_agri_config):
+        agri = agri_rsr.AGRIRSR('ch1', 'FY-4B')
+    np.testing.assert_allclose(agri.rsr['wavelength'], [0.5, 0.501])
+    np.testing.assert_allclose(agri.rsr['response'], [0.005, 0.8])
+
+
+def test_config_cached_per_platform(fake_agri_config):
+    """Test that a second band instance reuses the cached config and band filenames."""
+    with patch('pyspectral.raw_reader.get_config', return_value=fake_agri_config) as get_config:
+        agri1 = agri_rsr.AGRIRSR('ch1', 'FY-4B')
+        agri7 = agri_rsr.AGRIRSR('ch7', 'FY-4B')
+    get_config.assert_called_once()
+    assert agri7.output_dir == agri1.output_dir
+    assert agri7.filenames == agri1.filenames
+    assert agri7.filenames is not agri1.filenames
+
+    agri_rsr.AGRIRSR.clear_cache()
+    with patch('pyspectral.raw_reader.get_config', return_value=fake_agri_config) as get_config:
+        agri_rsr.AGRIRSR('ch1', 'FY-4B')
+    get_config.assert_called_once()
@@ -264,6 +264,8 @@ class TestRayleigh:
         zenith_angle = np.array([79., 69., 32., np.nan])
         result = _clip_angles_inside_coordinate_range(zenith_angle, 2.75)
         np.testing.assert_allclose(result, TEST_ZENITH_ANGLES_RESULTS)
+        # The input angles are left untouched
+        np.testing.assert_equal(zenith_angle, np.array([79., 69., 32., np.nan]))
 
     def test_rayleigh_reduction(self, fake_lut_hdf5):
         """Test the code that reduces Rayleigh correction for high zenith angles."""
@@ -352,6 +354,19 @@ class TestRayleigh:
         assert isinstance(refl_corr, np.ndarray)
         np.testing.assert_allclose(refl_corr, exp_result)
 
+    @patch('pyspectral.rayleigh.da', None)
+    def test_get_reflectance_float32_angles(self, fake_lut_hdf5):
+        """Test getting the reflectance correction with single precision angles."""
+        rayl = _create_rayleigh()
+        sun_zenith = np.array([60., 20.], dtype=np.float32)
+        sat_zenith = np.array([49., 26.], dtype=np.float32)
+        azidiff = np.array([140., 130.], dtype=np.float32)
+        redband_refl = np.array([12., 8.], dtype=np.float32)
+        with mocked_rsr():
+            refl_corr = rayl.get_reflectance(
+                sun_zenith, sat_zenith, azidiff, 'ch3', redband_refl)
+        np.testing.assert_allclose(refl_corr, TEST_RAYLEIGH_RESULT2, rtol=1e-5)
+
     @patch('pyspectral.rayleigh.da', None)
     def test_get_reflectance_no_rsr(self, fake_lut_hdf5):
         """Test getting the reflectance correction, simulating that we have no RSR data."""
@@ -148,6 +148,16 @@ class TestUtils(unittest.TestCase):
         wvn_res = RESULT_RSR['20']['det-1']['wavenumber']
         wvn = newrsr['20']['det-1']['wavenumber']
         self.assertTrue(np.allclose(wvn_res, wvn))
+        np.testing.assert_equal(newrsr['20']['det-1']['response'], TEST_RSR['20']['det-1']['response'][::-1])
+
+    def test_convert2wavenumber_response_dict(self):
+        """Test the conversion to wavenumber with one response per satellite."""
+        resp = TEST_RSR['20']['det-1']['response']
+        rsr = {'20': {'det-1': {'wavelength': TEST_RSR['20']['det-1']['wavelength'],
+                                'response': {'sat1': resp, 'sat2': resp * 0.5}}}}
+        newrsr, _ = utils.convert2wavenumber(rsr)
+        np.testing.assert_equal(newrsr['20']['det-1']['response']['sat1'], resp[::-1])
+        np.testing.assert_equal(newrsr['20']['det-1']['response']['sat2'], resp[::-1] * 0.5)
 
     def test_convert2hdf5(self):
         """Test the conversion utility from original RSR to HDF5."""
@@ -211,6 +221,57 @@ class TestUtils(unittest.TestCase):
         np.testing.assert_equal(x_vals, x_sorted)
         np.testing.assert_equal(y_vals, y_sorted)
 
+        # Already sorted data are returned unchanged
+        x_vals, y_vals = utils.sort_data(x_sorted, y_sorted)
+        np.testing.assert_equal(x_vals, x_sorted)
+        np.testing.assert_equal(y_vals, y_sorted)
+
+        # Points with NaN x values are dropped
+        x_vals, y_vals = utils.sort_data(np.array([3., np.nan, 1., np.nan]), np.array([30., 5., 10., 6.]))
+        np.testing.assert_equal(x_vals, np.array([1., 3.]))
+        np.testing.assert_equal(y_vals, np.array([10., 30.]))
+
+    @staticmethod
+    def test_get_central_wave():
+        """Test the central wavelength against a plain trapezoidal integration."""
+        wvl = TEST_RSR['20']['det-1']['wavelength'].astype('float64')
+        resp = TEST_RSR['20']['det-1']['response'].astype('float64')
+        weight = 1. / wvl**4
+        expected = np.trapz(resp * wvl * weight, wvl) / np.trapz(resp * weight, wvl)
+
+        np.testing.assert_allclose(utils.get_central_wave(wvl, resp, weight=weight), expected)
+        np.testing.assert_allclose(utils.get_trapezoid_weights(wvl) @ resp, np.trapz(resp, wvl))
+
+        trapz_weights = utils.get_trapezoid_weights(wvl)
+        np.testing.assert_allclose(utils.get_central_wave_precomputed(trapz_weights, wvl, resp, weight),
+                                   expected)
+
+        # One response per row, e.g. one per detector
+        wvl_2d = np.linspace(0.4, 0.5, 10)
+        resp_2d = np.array([np.linspace(0., 1., 10), np.linspace(1., 0., 10)])
+        expected = np.trapz(resp_2d * wvl_2d, wvl_2d) / np.trapz(resp_2d, wvl_2d)
+        np.testing.assert_allclose(utils.get_central_wave(wvl_2d, resp_2d), expected)
+
+        # Integer wavelength grid, e.g. in nanometers
+        wvl_nm = np.arange(400, 436)
+        expected = np.trapz(resp * wvl_nm, wvl_nm) / np.trapz(resp, wvl_nm)
+        np.testing.assert_allclose(utils.get_central_wave(wvl_nm, resp), expected)
+
+        # Integer response and weight
+        resp_int = np.arange(wvl_nm.size)
+        expected = np.trapz(resp_int * wvl_nm, wvl_nm) / np.trapz(resp_int, wvl_nm)
+        np.testing.assert_allclose(utils.get_central_wave(wvl_nm, resp_int, weight=1), expected)
+
+        # Wavelength grid given as a list
+        wvl_list = [1., 2., 3.]
+        resp_list = np.array([0., 1., 0.])
+        np.testing.assert_allclose(utils.get_central_wave(wvl_list, resp_list), 2.)
+
+        # One wavelength grid per row
+        wvl_rows = np.array([np.linspace(0.4, 0.5, 10), np.linspace(0.6, 0.8, 10)])
+        expected = np.trapz(resp_2d * wvl_rows, wvl_rows) / np.trapz(resp_2d, wvl_rows)
+        np.testing.assert_allclose(utils.get_central_wave(wvl_rows, resp_2d), expected)
+
     def test_get_wave_range(self):
         """Test the function that produces wavelength ranges from an RSR."""
         wvl_range = utils.get_wave_range(self.rsr.rsr['ch3']['det-1'], 0.15)
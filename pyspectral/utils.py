@@ -167,37 +167,41 @@ def convert2wavenumber(rsr):
 
     """
     retv = {}
-    for chname in rsr.keys():  # Go through bands/channels
+    for chname, band in rsr.items():  # Go through bands/channels
         retv[chname] = {}
-        for det in rsr[chname].keys():  # Go through detectors
-            retv[chname][det] = {}
-            if 'wavenumber' in rsr[chname][det].keys():
+        for det, detdict in band.items():  # Go through detectors
+            if 'wavenumber' in detdict:
                 # Make a copy. Data are already in wave number space
-                retv[chname][det] = rsr[chname][det].copy()
+                retv[chname][det] = detdict.copy()
                 LOG.debug("RSR data already in wavenumber space. No conversion needed.")
                 continue
 
-            for sat in rsr[chname][det].keys():
+            retv[chname][det] = {}
+            for sat, values in detdict.items():
                 if sat == "wavelength":
-                    # micro meters to cm
-                    wnum = 1. / (1e-4 * rsr[chname][det][sat])
-                    retv[chname][det]['wavenumber'] = wnum[::-1]
+                    retv[chname][det]['wavenumber'] = _wavelength2wavenumber(values)
                 elif sat == "response":
-                    # Flip the response array:
-                    if isinstance(rsr[chname][det][sat], dict):
-                        retv[chname][det][sat] = {}
-                        for name in rsr[chname][det][sat].keys():
-                            resp = rsr[chname][det][sat][name]
-                            retv[chname][det][sat][name] = resp[::-1]
-                    else:
-                        resp = rsr[chname][det][sat]
-                        retv[chname][det][sat] = resp[::-1]
+                    retv[chname][det][sat] = _flip_response(values)
 
     unit = 'cm-1'
     si_scale = 100.0
     return retv, {'unit': unit, 'si_scale': si_scale}
 
 
+def _wavelength2wavenumber(wavelength):
+    """Convert wavelengths in micro meters to wavenumbers in cm-1, in increasing order."""
+    wnum = np.multiply(wavelength, 1e-4)
+    np.reciprocal(wnum, out=wnum)
+    return np.ascontiguousarray(wnum[::-1])
+
+
+def _flip_response(response):
+    """Flip the response array, or each of the response arrays in a dict."""
+    if isinstance(response, dict):
+        return {name: _flip_response(resp) for name, resp in response.items()}
+    return np.ascontiguousarray(response[::-1])
+
+
 def get_central_wave(wav, resp, weight=1.0):
     """Calculate the central wavelength or the central wavenumber.
 
@@ -217,7 +221,35 @@ def get_central_wave(wav, resp, weight=1.0):
     # if info['unit'].find('-1') > 0:
     # Wavenumber:
     #     res *=
-    return np.trapz(resp * wav * weight, wav) / np.trapz(resp * weight, wav)
+    return get_central_wave_precomputed(get_trapezoid_weights(wav), wav, resp, weight)
+
+
+def get_central_wave_precomputed(trapz_weights, wav, resp, weight=1.0):
+    """Calculate the central wavelength or wavenumber from precomputed trapezoid weights.
+
+    Same as :func:`get_central_wave`, but the trapezoid weights from
+    :func:`get_trapezoid_weights` are passed in, so that they only need to be
+    derived once when several responses share the same *wav* grid.
+
+    """
+    # Fold the trapezoid weights into the response once, so both integrals share one temporary
+    integrand = np.multiply(resp * weight, trapz_weights)
+    return np.einsum('...i,...i->...', integrand, wav) / integrand.sum(axis=-1)
+
+
+def get_trapezoid_weights(wav):
+    """Get the weights turning a trapezoidal integral over *wav* into a dot product.
+
+    ``np.trapz(y, wav)`` equals ``(y * get_trapezoid_weights(wav)).sum(axis=-1)``,
+    integrating along the last axis as :func:`numpy.trapz` does.
+
+    """
+    wav = np.asarray(wav)
+    trapz_weights = np.zeros(wav.shape, dtype=np.result_type(wav, 0.5))
+    half_steps = 0.5 * np.diff(wav)
+    trapz_weights[..., :-1] += half_steps
+    trapz_weights[..., 1:] += half_steps
+    return trapz_weights
 
 
 def get_bandname_from_wavelength(sensor, wavelength, rsr, epsilon=0.1, multiple_bands=False):
@@ -243,22 +275,21 @@ def get_bandname_from_wavelength(sensor, wavelength, rsr, epsilon=0.1, multiple_
 
 def sort_data(x_vals, y_vals):
     """Sort the data so that x is monotonically increasing and contains no duplicates."""
-    # Sort data
+    # Nothing to do if the data are already strictly increasing
+    if (np.diff(x_vals) > 0).all():
+        return x_vals, y_vals
+
+    # Sort and de-duplicate data, keeping the first occurrence of each x value
     # (This is needed in particular for EOS-Terra responses, as there are duplicates)
-    idxs = np.argsort(x_vals)
-    x_vals = x_vals[idxs]
-    y_vals = y_vals[idxs]
-
-    # De-duplicate data
-    mask = np.r_[True, (np.diff(x_vals) > 0)]
-    if not mask.all():
-        numof_duplicates = np.repeat(mask, np.equal(mask, False)).shape[0]
+    # Points with NaN x values are dropped, as np.unique would keep one of them
+    valid = ~np.isnan(x_vals)
+    x_sorted, first_idxs = np.unique(x_vals[valid], return_index=True)
+    numof_duplicates = x_vals.size - x_sorted.size
+    if numof_duplicates:
         LOG.debug("Number of duplicates in the response function: %d - removing them",
                   numof_duplicates)
-    x_vals = x_vals[mask]
-    y_vals = y_vals[mask]
 
-    return x_vals, y_vals
+    return x_sorted, y_vals[valid][first_idxs]
 
 
 def convert2hdf5(ClassIn, platform_name, bandnames, scale=1e-06, detectors=None):
@@ -309,10 +340,11 @@ def convert2hdf5(ClassIn, platform_name, bandnames, scale=1e-06, detectors=None)
                 dset = grp.create_dataset('response', arr.shape, dtype='f')
                 dset[...] = arr
             else:
+                trapz_weights = get_trapezoid_weights(wvl)
                 for cur_det in detectors:
                     det_grp = grp.create_group(cur_det)
                     rsp = sensor.rsr[cur_det]['response'][~np.isnan(sensor.rsr[cur_det]['wavelength'])]
-                    det_grp.attrs['central_wavelength'] = get_central_wave(wvl, rsp)
+                    det_grp.attrs['central_wavelength'] = get_central_wave_precomputed(trapz_weights, wvl, rsp)
                     arr = sensor.rsr[cur_det]['response']
                     dset = det_grp.create_dataset('response', arr.shape, dtype='f')
                     dset[...] = arr
@@ -21,6 +21,7 @@
 
 Data from http://satellite.nsmc.org.cn/PortalSite/StaticContent/DocumentDownload.aspx?TypeID=590
 """
+import logging
 import os
 
 import numpy as np
@@ -30,6 +31,8 @@ from pyspectral.utils import INSTRUMENTS
 from pyspectral.utils import convert2hdf5 as tohdf5
 from pyspectral.utils import get_logger, logging_on
 
+LOG = logging.getLogger(__name__)
+
 FY4_AGRI_BAND_NAMES = ['ch1', 'ch2', 'ch3', 'ch4', 'ch5', 'ch6', 'ch7', 'ch8',
                        'ch9', 'ch10', 'ch11', 'ch12', 'ch13', 'ch14', 'ch15']
 BANDNAME_SCALE2MICROMETERS = {'FY-4A': {'ch1': 0.001,
@@ -66,6 +69,10 @@ BANDNAME_SCALE2MICROMETERS = {'FY-4A': {'ch1': 0.001,
 class AGRIRSR(InstrumentRSR):
     """Container for the FY-4 AGRI RSR data."""
 
+    # Config options and band filenames per platform, shared by all band instances
+    # of one conversion run (see clear_cache)
+    _cache = {}
+
     def __init__(self, bandname, platform_name):
         """Initialise the FY-4 AGRI relative spectral response data."""
         if platform_name == 'FY-4A':
@@ -77,9 +84,7 @@ class AGRIRSR(InstrumentRSR):
         if type(self.instrument) is list:
             self.instrument = 'agri'
 
-        self._get_options_from_config()
-        self._get_bandfilenames()
-
+        self._get_cached_options_and_bandfilenames()
 
         LOG.debug("Filenames: %s", str(self.filenames))
         if self.filenames[bandname] and os.path.exists(self.filenames[bandname]):
@@ -98,35 +103,49 @@ class AGRIRSR(InstrumentRSR):
 
         self.filename = self.requested_band_filename
 
+    @classmethod
+    def clear_cache(cls):
+        """Forget the cached config options and band filenames, e.g. after the config changed."""
+        cls._cache.clear()
+
+    def _get_cached_options_and_bandfilenames(self):
+        """Get the config options and band filenames, reading the config only once per platform."""
+        if self.platform_name not in AGRIRSR._cache:
+            self._get_options_from_config()
+            self._get_bandfilenames()
+            AGRIRSR._cache[self.platform_name] = (self.options, self.output_dir, self.path,
+                                                  self.filename, self.filenames.copy())
+        else:
+            (self.options, self.output_dir, self.path,
+             self.filename, filenames) = AGRIRSR._cache[self.platform_name]
+            self.filenames = filenames.copy()
+
     def _load(self, scale=0.001):
         """Load the AGRI RSR data for the band requested.
 
         Wavelength is given in nanometers.
         """
-        data = np.genfromtxt(self.requested_band_filename,
-                             unpack=True, delimiter='\t',
-                             names=['wavelength',
-                                    'response'],
-                             skip_header=1)
+        wavelength, response = np.loadtxt(self.requested_band_filename,
+                                          delimiter='\t', skiprows=1, usecols=(0, 1),
+                                          unpack=True, dtype=np.float64)
 
-        wavelength = data[0] * scale
-        response = data[1]
+        wavelength = wavelength * scale
 
         # Response can be either 0-1 or 0-100 depending on RSR source - this scales to 0-1 range.
-        if np.nanmax(response > 1):
-            response = response / 100.
+        if np.nanmax(response) > 1:
+            response *= 0.01
 
         # Cut unneeded points
-        pts = np.argwhere(response > 0.001)
-
-        wavelength = np.squeeze(wavelength[pts])
-        response = np.squeeze(response[pts])
+        mask = response > 0.001
 
-        self.rsr = {'wavelength': wavelength, 'response': response}
+        self.rsr = {'wavelength': wavelength[mask], 'response': response[mask]}
 
 
 def convert_agri():
     """Read original AGRI RSR data and convert to common Pyspectral hdf5 format."""
+    # Re-read the config for every conversion run
+    AGRIRSR.clear_cache()
+
     # For FY-4A
     # tohdf5(AGRIRSR, 'FY-4A', FY4_AGRI_BAND_NAMES[:-1])
 